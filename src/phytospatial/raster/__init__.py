@@ -19,6 +19,7 @@ from .io import (
     load,
     save,
     write_window,
+    write_windows,
     read_info,
     ensure_tiled_raster,
     resolve_raster
@@ -37,6 +38,7 @@ from .partition import (
     iter_blocks,
     iter_tiles,
     iter_windows,
+    iter_windows_array,
     TileStitcher,
     iter_core_halo
 )
@@ -65,7 +67,8 @@ from .utils import (
     extract_band_indices,
     extract_wavelength,
     map_wavelengths,
-    compute_statistics
+    compute_statistics,
+    fused_band_arithmetic
 )
 
 # Spectral index registry
@@ -96,6 +99,7 @@ __all__ = [
     "extract_wavelength",
     "map_wavelengths",
     "compute_statistics",
+    "fused_band_arithmetic",
     
     # Layer
     "Raster",
@@ -104,6 +108,7 @@ __all__ = [
     "load",
     "save",
     "write_window",
+    "write_windows",
     "read_info",
     "ensure_tiled_raster",
     "resolve_raster",
@@ -112,6 +117,7 @@ __all__ = [
     "iter_blocks",
     "iter_tiles",
     "iter_windows",
+    "iter_windows_array",
     "TileStitcher",
     "iter_core_halo",
 
@@ -8,7 +8,7 @@ from functools import wraps
 import inspect
 import logging
 from pathlib import Path
-from typing import Callable, Union, Optional, List, Dict, Any
+from typing import Callable, Union, Optional, List, Dict, Any, Iterable, Tuple
 
 import rasterio
 from rasterio.windows import Window
@@ -23,6 +23,7 @@ __all__ = [
     "load",
     "save",
     "write_window",
+    "write_windows",
     "read_info",
     "ensure_tiled_raster",
     "resolve_raster"
@@ -97,14 +98,21 @@ def save(
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    profile = raster.profile.copy()
+    profile = raster.profile
     profile.update(profile_kwargs)
 
     log.info(f"Saving raster {raster.shape} → {path}")
     
     try:
         with rasterio.open(path, 'w', **profile) as dst:
-            dst.write(raster.data)
+            if profile.get('tiled'):
+                # Feed the encoder one native block at a time to bound the transient buffer
+                data = raster.data
+                for _, window in dst.block_windows(1):
+                    row_slice, col_slice = window.toslices()
+                    dst.write(data[:, row_slice, col_slice], window=window)
+            else:
+                dst.write(raster.data)
             
             if raster.band_names:
                 for name, idx in raster.band_names.items():
@@ -124,6 +132,7 @@ def write_window(
     Write raster data to a specific window in an existing file.
     
     Useful for tile stitching. Target file must exist and handle the same schema.
+    Each call reopens the target; prefer write_windows() when writing many tiles.
     
     Args:
         raster: Raster object containing data to write
@@ -156,6 +165,54 @@ def write_window(
     except Exception as e:
         raise IOError(f"Failed to write window to {path}: {e}") from e
 
+def write_windows(
+    tiles: Iterable[Tuple[Window, Raster]],
+    path: Union[str, Path],
+    indexes: Optional[List[int]] = None
+    ) -> int:
+    """
+    Write a stream of (Window, Raster) pairs into an existing file in a single session.
+
+    Batch counterpart of write_window(): the target is opened once in 'r+' mode
+    for the whole stream instead of paying a GDAL open/flush per tile.
+
+    Args:
+        tiles: Iterable of (window, raster) pairs, e.g. the output of iter_windows().
+        path: Path to EXISTING raster file. All supported GDAL formats are accepted.
+        indexes: Optional list of band indices to write to.
+
+    Returns:
+        int: Number of tiles written.
+    """
+    path = Path(path)
+    
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Cannot write windows: target file does not exist: {path}\n"
+            f"Tip: Create the file first using save(), then write tiles to it."
+        )
+
+    written = 0
+    try:
+        with rasterio.open(path, 'r+') as dst:
+            for window, raster in tiles:
+                if indexes:
+                    if len(indexes) != raster.count:
+                        raise ValueError(
+                            f"Indexes length ({len(indexes)}) must match "
+                            f"raster band count ({raster.count})"
+                        )
+                    dst.write(raster.data, window=window, indexes=indexes)
+                else:
+                    dst.write(raster.data, window=window)
+                written += 1
+                
+    except Exception as e:
+        raise IOError(f"Failed to write windows to {path}: {e}") from e
+
+    log.debug(f"Wrote {written} windows → {path.name}")
+    return written
+
 def read_info(
         path: Union[str, Path]
         ) -> Dict[str, Any]:
@@ -171,9 +228,10 @@ def read_info(
         with rasterio.open(path) as src:
             band_names = {}
             wavelengths_nm = {}
+            descs = src.descriptions
             
             for i in src.indexes:
-                desc = src.descriptions[i - 1]
+                desc = descs[i - 1]
                 band_names[desc or f"Band_{i}"] = i
                 
                 tags = src.tags(i)
@@ -279,23 +337,29 @@ def resolve_raster(
             fit within the available system RAM for an in-memory operation.
     """
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        sig = inspect.signature(func)        
+        sig = inspect.signature(func)
+        raster_params = tuple(
+            name for name, param in sig.parameters.items()
+            if "Raster" in str(param.annotation) or "raster" in name.lower()
+        )
+
         @wraps(func)
         def wrapper(
             *args: Any, 
             **kwargs: Any
             ) -> Any:
+            if not raster_params:
+                return func(*args, **kwargs)
+
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
-            for name, param in sig.parameters.items():
+            for name in raster_params:
                 val = bound_args.arguments[name]
-                if val is None:
+                if val is None or type(val) is Raster:
                     continue
 
-                annot_str = str(param.annotation)
-                expects_raster = "Raster" in annot_str or "raster" in name.lower()
-                if expects_raster and isinstance(val, (str, Path)):
+                if isinstance(val, (str, Path)):
                     val_path = Path(val)
                     if not val_path.exists():
                         continue
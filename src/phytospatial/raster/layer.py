@@ -8,17 +8,27 @@ It synchronizes pixel data (NumPy array) with geospatial context (CRS, Transform
 
 import logging
 from typing import Union, Optional, Dict, Any, Tuple
-import copy
 
 import numpy as np
 import rasterio
 from rasterio.transform import Affine
 from rasterio.crs import CRS
 
+from phytospatial.raster.utils import fused_band_arithmetic, extract_wavelength, map_wavelengths
+from phytospatial.raster.indices import IndexCatalog
+
 log = logging.getLogger(__name__)
 
 __all__ = ["Raster"]
 
+_BAND_OPS = {
+    "add": 0,
+    "subtract": 1,
+    "multiply": 2,
+    "divide": 3,
+    "normalized_difference": 4
+}
+
 class Raster:
     """
     In-memory raster data container with geospatial metadata.
@@ -52,6 +62,8 @@ class Raster:
         Args:
             data: Pixel array. Must be 2D (Height, Width) or 3D (Bands, Height, Width).
                   2D arrays are automatically promoted to 3D (1, Height, Width).
+                  Non C-contiguous arrays (strided slices, transposes) are copied
+                  into C-contiguous storage so downstream kernels hit vectorized paths.
             transform: Geospatial transform (maps pixel coords to CRS coords)
             crs: Coordinate Reference System (EPSG code, proj string, or CRS object)
             nodata: Value indicating missing/invalid data
@@ -69,10 +81,14 @@ class Raster:
         if data.ndim == 2:
             data = data[np.newaxis, :, :]
 
+        if not data.flags['C_CONTIGUOUS']:
+            data = np.ascontiguousarray(data)
+
+        self._profile: Optional[Dict[str, Any]] = None
         self._data = data
-        self.transform = transform
-        self.crs = crs
-        self.nodata = nodata
+        self._transform = transform
+        self._crs = crs
+        self._nodata = nodata
         self.band_names = band_names or {}
 
     def _validate_inputs(
@@ -122,6 +138,7 @@ class Raster:
 
         Args:
             new_data: New pixel array (2D or 3D). 2D arrays are promoted to 3D.
+                      Non C-contiguous arrays are copied into C-contiguous storage.
         
         Raises:
             ValueError: If new_data is not 2D or 3D
@@ -131,8 +148,48 @@ class Raster:
         
         if new_data.ndim != 3:
             raise ValueError(f"New data must be 2D or 3D, got {new_data.ndim}D")
+
+        if not new_data.flags['C_CONTIGUOUS']:
+            new_data = np.ascontiguousarray(new_data)
             
         self._data = new_data
+        self._profile = None
+
+    @property
+    def transform(self) -> Affine:
+        """
+        Affine transform mapping pixel coordinates to CRS coordinates.
+        """
+        return self._transform
+
+    @transform.setter
+    def transform(self, value: Affine):
+        self._transform = value
+        self._profile = None
+
+    @property
+    def crs(self) -> CRS:
+        """
+        Coordinate Reference System of the raster.
+        """
+        return self._crs
+
+    @crs.setter
+    def crs(self, value: CRS):
+        self._crs = value
+        self._profile = None
+
+    @property
+    def nodata(self) -> Optional[Union[float, int]]:
+        """
+        Value representing missing data.
+        """
+        return self._nodata
+
+    @nodata.setter
+    def nodata(self, value: Optional[Union[float, int]]):
+        self._nodata = value
+        self._profile = None
 
     @property
     def width(self) -> int:
@@ -183,22 +240,27 @@ class Raster:
         This profile can be used with rasterio.open() to write the raster to disk.
         NOTE: Can override specific keys (compress='deflate') when saving using
         the **profile_kwargs in the save() function.
+
+        The profile is built once and cached until the data, transform, CRS or
+        nodata value changes. A copy is returned so callers may mutate it freely.
         
         Returns:
             Dict[str, Any]: Rasterio profile dictionary
         """
-        return {
-            'driver': 'GTiff',
-            'dtype': self._data.dtype,
-            'nodata': self.nodata,
-            'width': self.width,
-            'height': self.height,
-            'count': self.count,
-            'crs': self.crs,
-            'transform': self.transform,
-            'compress': 'lzw',
-            'tiled': True
-        }
+        if self._profile is None:
+            self._profile = {
+                'driver': 'GTiff',
+                'dtype': self._data.dtype,
+                'nodata': self._nodata,
+                'width': self.width,
+                'height': self.height,
+                'count': self.count,
+                'crs': self._crs,
+                'transform': self._transform,
+                'compress': 'lzw',
+                'tiled': True
+            }
+        return self._profile.copy()
     
     @property
     def memory_size(self) -> int:
@@ -242,16 +304,114 @@ class Raster:
         
         return self._data[idx - 1]
 
+    def band_expr(
+            self,
+            op: str,
+            band_a: Union[int, str],
+            band_b: Union[int, str],
+            dtype: Union[str, np.dtype] = np.float32
+            ) -> 'Raster':
+        """
+        Evaluate a binary band expression with a fused, JIT-compiled kernel.
+
+        Reads both bands and writes the result in a single pass, avoiding the
+        intermediate arrays NumPy allocates for compound expressions.
+        Pixels where either band equals nodata, or where a denominator is zero,
+        are set to NaN, which is also the nodata value of the result. The source 
+        nodata is not reused, as it may be a valid result (e.g. 0 for NDVI).
+
+        Args:
+            op: One of 'add', 'subtract', 'multiply', 'divide', 'normalized_difference'
+            band_a: 1-based index or semantic name of the first operand
+            band_b: 1-based index or semantic name of the second operand
+            dtype: Floating point output data type. Defaults to float32.
+
+        Returns:
+            Raster: Single-band Raster sharing this raster's grid, with NaN nodata
+
+        Raises:
+            ValueError: If op is not a supported operation or dtype is not a float type
+        """
+        if op not in _BAND_OPS:
+            raise ValueError(f"Unsupported band operation '{op}'. Must be one of: {list(_BAND_OPS)}")
+
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"Band expressions require a floating point dtype to hold NaN nodata, got '{dtype}'")
+
+        a = np.ascontiguousarray(self.get_band(band_a))
+        b = np.ascontiguousarray(self.get_band(band_b))
+        out = np.empty(a.shape, dtype=dtype)
+
+        has_nodata = self.nodata is not None
+        nodata = float(self.nodata) if has_nodata else np.nan
+        fused_band_arithmetic(a, b, _BAND_OPS[op], np.nan, nodata, has_nodata, out)
+
+        return Raster(
+            data=out,
+            transform=self.transform,
+            crs=self.crs,
+            nodata=np.nan,
+            band_names={op: 1}
+        )
+
+    def ndvi(
+            self,
+            nir: Optional[Union[int, str]] = None,
+            red: Optional[Union[int, str]] = None,
+            max_tolerance: float = 20.0
+            ) -> 'Raster':
+        """
+        Compute the Normalized Difference Vegetation Index, (nir - red) / (nir + red).
+
+        Bands left unspecified are resolved like generate_index() does: the NDVI entry 
+        of the IndexCatalog supplies the target wavelengths, which are matched against 
+        wavelengths parsed from the band names (e.g. "850nm").
+        The in-memory result is evaluated with band_expr() so masked pixels come back as NaN.
+
+        Args:
+            nir: 1-based index or semantic name of the near-infrared band. Defaults to wavelength matching.
+            red: 1-based index or semantic name of the red band. Defaults to wavelength matching.
+            max_tolerance: Maximum wavelength mismatch in nm when matching bands. Defaults to 20.0.
+
+        Returns:
+            Raster: Single-band float32 NDVI Raster
+
+        Raises:
+            ValueError: If a band must be matched by wavelength and no band name carries one within tolerance
+        """
+        if nir is None or red is None:
+            parsed_wavelengths = {}
+            for name, idx in self.band_names.items():
+                wvl = extract_wavelength(name)
+                if wvl >= 0:
+                    parsed_wavelengths[wvl] = idx
+
+            mapping = map_wavelengths(
+                parsed_wavelengths=parsed_wavelengths,
+                required_wavelengths=IndexCatalog().get("NDVI").wavelengths,
+                max_tolerance=max_tolerance
+            )
+            nir = mapping["nir"] if nir is None else nir
+            red = mapping["red"] if red is None else red
+
+        result = self.band_expr("normalized_difference", nir, red)
+        result.band_names = {"NDVI": 1}
+        return result
+
     def copy(self) -> 'Raster':
         """
         Create a deep copy of the Raster.
+
+        Pixel data and band names are duplicated. The transform and CRS are
+        shared by reference, which is safe because both are immutable.
         
         Returns:
             Raster: Independent copy with duplicated data and metadata
         """
         return Raster(
             data=self._data.copy(),
-            transform=copy.deepcopy(self.transform),
+            transform=self.transform,  # Affine is an immutable namedtuple
             crs=self.crs,  # CRS is immutable, no need to copy
             nodata=self.nodata,
             band_names=self.band_names.copy()
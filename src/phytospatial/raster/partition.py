@@ -9,6 +9,8 @@ into a single raster file on disk.
 """
 
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union, Optional, List, Iterator, Tuple, Dict, Any
 
@@ -29,6 +31,7 @@ __all__ = [
     "iter_blocks",
     "iter_tiles", 
     "iter_windows",
+    "iter_windows_array",
     "TileStitcher",
     "iter_core_halo"
 ]
@@ -81,16 +84,24 @@ def iter_tiles(
     source: Union[str, Path, rasterio.DatasetReader],
     tile_size: Union[int, Tuple[int, int]] = 512,
     overlap: int = 0,
-    bands: Optional[Union[int, List[int]]] = None
+    bands: Optional[Union[int, List[int]]] = None,
+    prefetch: Optional[int] = None
     ) -> Iterator[Tuple[Window, Raster]]:
     """
     Stream data using a virtual grid of fixed-size tiles.
 
+    When a path is given, each read runs with GDAL multithreaded decoding enabled, and 
+    reads are issued ahead of the consumer by a single background thread so that 
+    decompression overlaps with downstream processing. Dataset metadata is captured 
+    before iteration starts, so while prefetching the handle is only touched by that thread.
+
     Args:
         source (Union[str, Path, rasterio.DatasetReader]): An open rasterio.DatasetReader, or a path to the raster file.
         tile_size (Union[int, Tuple[int, int]]): Dimensions (width, height) or single int for square tiles.
         overlap (int): Pixels of overlap between tiles.
         bands (Optional[Union[int, List[int]]]): Specific band(s) to load (None=all, int=single, list=subset).
+        prefetch (Optional[int]): Number of tiles read ahead of the consumer. 0 disables prefetching. 
+            Defaults to 2 for paths and 0 for caller-supplied datasets, which may be shared with other readers.
 
     Yields:
         Tuple[Window, Raster]: A window and corresponding Raster object.
@@ -106,27 +117,55 @@ def iter_tiles(
     step_w = t_width - overlap
     step_h = t_height - overlap
 
-    def _generator(src: rasterio.DatasetReader) -> Iterator[Tuple[Window, Raster]]:
+    def _generator(
+        src: rasterio.DatasetReader,
+        prefetch: int,
+        threaded: bool
+        ) -> Iterator[Tuple[Window, Raster]]:
         indices = extract_band_indices(src, bands)
-        
-        for row_off in range(0, src.height, step_h):
-            for col_off in range(0, src.width, step_w):
-                width = min(t_width, src.width - col_off)
-                height = min(t_height, src.height - row_off)
-                
-                window = Window(col_off, row_off, width, height)
-                
-                data = src.read(indexes=indices, window=window)
-                tile_transform = src.window_transform(window)
-                band_names = extract_band_names(src, indices)
-                
-                yield window, Raster(
-                    data=data,
-                    transform=tile_transform,
-                    crs=src.crs,
-                    nodata=src.nodata,
-                    band_names=band_names
-                )
+        band_names = extract_band_names(src, indices)
+        src_width, src_height = src.width, src.height
+        src_transform, src_crs, src_nodata = src.transform, src.crs, src.nodata
+
+        def _windows() -> Iterator[Window]:
+            for row_off in range(0, src_height, step_h):
+                for col_off in range(0, src_width, step_w):
+                    width = min(t_width, src_width - col_off)
+                    height = min(t_height, src_height - row_off)
+                    yield Window(col_off, row_off, width, height)
+
+        def _read(window: Window) -> np.ndarray:
+            if not threaded:
+                return src.read(indexes=indices, window=window)
+            # Scoped to the read so no GDAL environment outlives it across yields
+            with rasterio.Env(GDAL_NUM_THREADS='ALL_CPUS'):
+                return src.read(indexes=indices, window=window)
+
+        def _wrap(window: Window, data: np.ndarray) -> Tuple[Window, Raster]:
+            return window, Raster(
+                data=data,
+                transform=compute_window_transform(window, src_transform),
+                crs=src_crs,
+                nodata=src_nodata,
+                band_names=band_names.copy()
+            )
+
+        if prefetch <= 0:
+            for window in _windows():
+                yield _wrap(window, _read(window))
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque()
+            for window in _windows():
+                pending.append((window, executor.submit(_read, window)))
+                if len(pending) > prefetch:
+                    ready_window, future = pending.popleft()
+                    yield _wrap(ready_window, future.result())
+
+            while pending:
+                ready_window, future = pending.popleft()
+                yield _wrap(ready_window, future.result())
 
     if isinstance(source, (str, Path)):
         path = resolve_envi_path(Path(source))
@@ -135,31 +174,33 @@ def iter_tiles(
             
         try:
             with rasterio.open(path) as src:
-                yield from _generator(src)
+                yield from _generator(src, 2 if prefetch is None else prefetch, threaded=True)
         except rasterio.RasterioIOError as e:
             raise IOError(f"Tile iteration failed for {path}: {e}") from e
     else:
         # If an open dataset is passed directly, bypass the context manager
-        yield from _generator(source)
+        yield from _generator(source, prefetch or 0, threaded=False)
 
 
-def iter_windows(
-    raster: Raster,
+def iter_windows_array(
+    data: np.ndarray,
     tile_size: Union[int, Tuple[int, int]] = 512,
     overlap: int = 0
-    ) -> Iterator[Tuple[Window, Raster]]:
+    ) -> Iterator[Tuple[Window, np.ndarray]]:
     """
-    Partition an in-memory Raster object into smaller Raster tiles.
-    
-    Useful for batch processing a loaded raster, notably for neural networks.
-    
+    Partition an in-memory (Bands, Height, Width) array into tile views.
+
+    Lightweight counterpart of iter_windows() that yields bare NumPy views and
+    never builds a Raster per tile. Use rasterio.windows.transform(window, transform)
+    to recover the geospatial transform of a tile when it is needed.
+
     Args:
-        raster (Raster): The source Raster object (already in memory).
+        data (np.ndarray): 3D pixel array in (Bands, Height, Width) format.
         tile_size (Union[int, Tuple[int, int]]): Dimensions (width, height) or single int for square tiles.
         overlap (int): Pixels of overlap.
-        
+
     Yields:
-        Tuple[Window, Raster]: A deep copy of the sliced data as a new Raster.
+        Tuple[Window, np.ndarray]: A window and a view (not a copy) of the sliced data.
     """
     if isinstance(tile_size, int):
         t_width, t_height = tile_size, tile_size
@@ -171,12 +212,13 @@ def iter_windows(
 
     step_w = t_width - overlap
     step_h = t_height - overlap
+    src_height, src_width = data.shape[-2], data.shape[-1]
     
-    for row_off in range(0, raster.height, step_h):
-        for col_off in range(0, raster.width, step_w):
+    for row_off in range(0, src_height, step_h):
+        for col_off in range(0, src_width, step_w):
             
-            width = min(t_width, raster.width - col_off)
-            height = min(t_height, raster.height - row_off)
+            width = min(t_width, src_width - col_off)
+            height = min(t_height, src_height - row_off)
             
             window = Window(
                 col_off=col_off,
@@ -185,23 +227,68 @@ def iter_windows(
                 height=height
             )
 
-            tile_data = raster.data[
+            yield window, data[
                 :, 
                 row_off : row_off + height, 
                 col_off : col_off + width
-            ].copy() 
-            
-            tile_transform = compute_window_transform(window, raster.transform)
-            
-            tile_raster = Raster(
-                data=tile_data,
-                transform=tile_transform,
-                crs=raster.crs,
-                nodata=raster.nodata,
-                band_names=raster.band_names.copy()
-            )
-            
-            yield window, tile_raster
+            ]
+
+def _is_empty_tile(
+    tile: np.ndarray,
+    nodata: Union[float, int]
+    ) -> bool:
+    """
+    Helper that checks whether every pixel of a tile equals nodata.
+
+    A strided 1/16 sample is tested first so tiles holding valid data usually
+    exit after touching a small fraction of their pixels.
+    """
+    def _has_valid(arr: np.ndarray) -> bool:
+        if np.isnan(nodata):
+            return bool(np.any(~np.isnan(arr)))
+        return bool(np.any(arr != nodata))
+
+    if _has_valid(tile[..., ::16, ::16]):
+        return False
+    return not _has_valid(tile)
+
+def iter_windows(
+    raster: Raster,
+    tile_size: Union[int, Tuple[int, int]] = 512,
+    overlap: int = 0,
+    skip_empty: bool = False
+    ) -> Iterator[Tuple[Window, Raster]]:
+    """
+    Partition an in-memory Raster object into smaller Raster tiles.
+    
+    Useful for batch processing a loaded raster, notably for neural networks.
+    See iter_windows_array() when only the pixel arrays are needed.
+    
+    Args:
+        raster (Raster): The source Raster object (already in memory).
+        tile_size (Union[int, Tuple[int, int]]): Dimensions (width, height) or single int for square tiles.
+        overlap (int): Pixels of overlap.
+        skip_empty (bool): If True, tiles made entirely of nodata are not yielded.
+            Has no effect when the raster has no nodata value. Defaults to False.
+        
+    Yields:
+        Tuple[Window, Raster]: A deep copy of the sliced data as a new Raster.
+    """
+    check_empty = skip_empty and raster.nodata is not None
+
+    for window, tile_view in iter_windows_array(raster.data, tile_size=tile_size, overlap=overlap):
+        if check_empty and _is_empty_tile(tile_view, raster.nodata):
+            continue
+
+        tile_raster = Raster(
+            data=tile_view.copy(),
+            transform=compute_window_transform(window, raster.transform),
+            crs=raster.crs,
+            nodata=raster.nodata,
+            band_names=raster.band_names.copy()
+        )
+        
+        yield window, tile_raster
 
 def iter_core_halo(
     source: Union[str, Path, Raster],
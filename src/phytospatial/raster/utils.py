@@ -13,7 +13,7 @@ from pathlib import Path
 from typing import Tuple, Union, List, Optional, Dict
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 import rasterio
 
 log = logging.getLogger(__name__)
@@ -24,7 +24,8 @@ __all__ = [
     "extract_band_names",
     "map_wavelengths",
     "extract_wavelength",
-    "compute_statistics"
+    "compute_statistics",
+    "fused_band_arithmetic"
 ]
 
 def resolve_envi_path(
@@ -61,13 +62,16 @@ def extract_band_names(
     """
     Extract descriptions/names for specific bands.
     """
-    band_names = {}
-    for i, idx in enumerate(indices):
-        if 0 <= (idx - 1) < len(src.descriptions):
-            desc = src.descriptions[idx - 1]
-            if desc:
-                band_names[desc] = i + 1
-    return band_names
+    descs = src.descriptions
+    if not any(descs):
+        return {}
+
+    n_descs = len(descs)
+    return {
+        descs[idx - 1]: i + 1
+        for i, idx in enumerate(indices)
+        if 0 <= (idx - 1) < n_descs and descs[idx - 1]
+    }
 
 def extract_wavelength(band_name: str) -> float:
     match = re.search(r'(\d+(?:\.\d+)?)\s*(?:nm|nanometers?)', band_name, re.IGNORECASE)
@@ -119,4 +123,58 @@ def compute_statistics(
     sd = np.std(pixel_array)
     min_v = np.min(pixel_array)
     max_v = np.max(pixel_array)
-    return med, mean, sd, min_v, max_v
\ No newline at end of file
+    return med, mean, sd, min_v, max_v
+
+@njit(parallel=True, cache=True)
+def fused_band_arithmetic(
+    band_a: np.ndarray,
+    band_b: np.ndarray,
+    op_id: int,
+    fill_value: float,
+    nodata: float,
+    has_nodata: bool,
+    out: np.ndarray
+    ) -> None:
+    """
+    Evaluates an element-wise arithmetic expression between two bands in a single fused pass.
+
+    Avoids the intermediate temporaries NumPy allocates for compound expressions such as
+    (a - b) / (a + b). fastmath is deliberately left off so NaN nodata comparisons stay exact.
+
+    Args:
+        band_a (np.ndarray): First 2D operand.
+        band_b (np.ndarray): Second 2D operand, same shape as band_a.
+        op_id (int): Operation selector (0=add, 1=subtract, 2=multiply, 3=divide, 4=normalized difference).
+        fill_value (float): Value written where either operand is nodata or a denominator is zero.
+        nodata (float): Nodata value of the operands, ignored when has_nodata is False.
+        has_nodata (bool): Whether operand pixels equal to nodata should be masked.
+        out (np.ndarray): Preallocated 2D output array receiving the result.
+    """
+    height, width = band_a.shape
+    nodata_is_nan = has_nodata and np.isnan(nodata)
+
+    for i in prange(height):
+        for j in range(width):
+            a = np.float64(band_a[i, j])
+            b = np.float64(band_b[i, j])
+
+            if has_nodata:
+                if nodata_is_nan:
+                    if np.isnan(a) or np.isnan(b):
+                        out[i, j] = fill_value
+                        continue
+                elif a == nodata or b == nodata:
+                    out[i, j] = fill_value
+                    continue
+
+            if op_id == 0:
+                out[i, j] = a + b
+            elif op_id == 1:
+                out[i, j] = a - b
+            elif op_id == 2:
+                out[i, j] = a * b
+            elif op_id == 3:
+                out[i, j] = a / b if b != 0.0 else fill_value
+            else:
+                denom = a + b
+                out[i, j] = (a - b) / denom if denom != 0.0 else fill_value
@@ -16,6 +16,7 @@ from .layer import (
 
 from .io import (
     load_vector,
+    load_vectors,
     save_vector,
     resolve_vector
 )
@@ -50,6 +51,7 @@ __all__ = [
     # I/O and data structure
     "Vector",
     "load_vector",
+    "load_vectors",
     "save_vector",
     "resolve_vector",
 
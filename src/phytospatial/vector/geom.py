@@ -67,31 +67,38 @@ def validate(
 
     Returns:
         Vector: A Vector object with validated geometries. If inplace is True, returns the modified input Vector.
+                The result is flagged as validated when no invalid geometry remains, which lets 
+                prepare_itcd_vectors skip its validation pass. validate() itself always re-checks.
     """                    
     gdf = vector.data if inplace else vector.data.copy()
     invalid_mask = ~gdf.is_valid
     
-    if not invalid_mask.any():
-        return vector if inplace else Vector(gdf)
-    
-    if fix_invalid:
-        gdf.loc[invalid_mask, 'geometry'] = gdf.loc[invalid_mask, 'geometry'].buffer(0)
-        still_invalid = ~gdf.is_valid
-        
-        if still_invalid.any() and drop_invalid:
-            gdf = gdf[gdf.is_valid]
-    elif drop_invalid:
-        gdf = gdf[gdf.is_valid]
+    if invalid_mask.any():
+        if fix_invalid:
+            # Repair only the invalid subset and re-check just those rows
+            fixed = gdf.loc[invalid_mask, 'geometry'].buffer(0)
+            gdf.loc[invalid_mask, 'geometry'] = fixed
+            invalid_mask = invalid_mask.copy()
+            invalid_mask[invalid_mask.to_numpy()] = ~fixed.is_valid.to_numpy()
+
+        if invalid_mask.any() and drop_invalid:
+            gdf = gdf[~invalid_mask]
+            invalid_mask = invalid_mask[~invalid_mask]
     
     if inplace:
         vector.data = gdf
-        return vector
-    return Vector(gdf)
+        result = vector
+    else:
+        result = Vector(gdf)
+
+    result._validated = not invalid_mask.any()
+    return result
 
 def filter_vector(
         vector: Vector, 
         condition: Union[pd.Series, Callable], 
-        inplace: bool = False
+        inplace: bool = False,
+        copy: bool = True
         ) -> Vector:
     """
     Filters the geometries in the Vector based on a boolean condition.
@@ -101,6 +108,9 @@ def filter_vector(
         condition (Union[pd.Series, Callable]): A boolean Series or a callable function that returns a boolean Series for filtering.
         inplace (bool): If True, modifies the input Vector in place. 
                         If False, returns a new Vector with filtered geometries. Defaults to False.
+        copy (bool): If True, the returned Vector owns a defensive copy of the filtered data. 
+                     If False, the copy is skipped, which halves peak memory when the caller 
+                     does not mutate the result. Ignored when inplace is True. Defaults to True.
 
     Returns:
         Vector: A Vector object with geometries filtered based on the condition. If inplace is True, returns the modified input Vector.
@@ -111,12 +121,13 @@ def filter_vector(
     if inplace:
         vector.data = filtered_gdf
         return vector
-    return Vector(filtered_gdf.copy())
+    return Vector(filtered_gdf.copy() if copy else filtered_gdf)
 
 def select_columns(
         vector: Vector, 
         columns: list, 
-        inplace: bool = False
+        inplace: bool = False,
+        copy: bool = True
         ) -> Vector:
     """
     Selects a subset of columns from the Vector's GeoDataFrame, ensuring that the geometry column is retained.
@@ -126,6 +137,8 @@ def select_columns(
         columns (list): A list of column names to select.
         inplace (bool): If True, modifies the input Vector in place. 
                         If False, returns a new Vector with the selected columns. Defaults to False.
+        copy (bool): If True, the returned Vector owns a defensive copy of the selected data. 
+                     If False, the copy is skipped. Ignored when inplace is True. Defaults to True.
 
     Returns:
         Vector: A Vector object with the selected columns. If inplace is True, returns the modified input Vector.
@@ -138,7 +151,7 @@ def select_columns(
     if inplace:
         vector.data = selected_gdf
         return vector
-    return Vector(selected_gdf.copy())
+    return Vector(selected_gdf.copy() if copy else selected_gdf)
 
 def force_Z(
     vector: Vector,
@@ -4,21 +4,29 @@
 This module provides functions for reading and writing vector data (points, lines, polygons) using GeoPandas.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 from pathlib import Path
-from typing import Union, Callable, Any, get_type_hints, get_origin, get_args
+from typing import Union, Callable, Any, Dict, List, Optional, Sequence, Tuple, get_type_hints, get_origin, get_args
 import inspect
 import logging
-from functools import wraps
-import logging
+from functools import wraps, lru_cache
 
 import geopandas as gpd
+import pandas as pd
 
 from phytospatial.vector.layer import Vector
 
 log = logging.getLogger(__name__)
 
+_PARQUET_SUFFIXES = frozenset((".parquet", ".geoparquet"))
+
+# pyarrow ships with the optional [analysis] extra; when present pyogrio can hand over Arrow buffers
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 __all__ = [
     "load_vector",
+    "load_vectors",
     "save_vector",
     "resolve_vector"
 ]
@@ -26,12 +34,27 @@ __all__ = [
 def load_vector(
         path: Union[str, Path], 
         engine: str = "pyogrio", 
+        columns: Optional[List[str]] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        where: Optional[str] = None,
         **kwargs: Any
         ) -> Vector:
     """Loads a vector dataset from the specified file path into a Vector object.
+
+    The columns, bbox and where filters are pushed down to the reader so that
+    unused attributes and out-of-extent features never leave GDAL.
+    Files with a .parquet or .geoparquet suffix are read as GeoParquet (requires pyarrow),
+    where the bbox filter skips row groups using the covering bounding-box statistics.
+    Other files read with pyogrio go through its Arrow stream when pyarrow is installed, 
+    avoiding the per-feature conversion into pandas objects.
+
     Args:
         path (Union[str, Path]): The absolute or relative system path resolving to the vector file.
         engine (str): The GeoPandas engine to use for reading the file. Defaults to "pyogrio".
+        columns (Optional[List[str]]): Attribute columns to read. The geometry is always read. Defaults to all.
+        bbox (Optional[Tuple[float, float, float, float]]): Spatial filter (minx, miny, maxx, maxy) 
+            expressed in the CRS of the dataset. Defaults to None.
+        where (Optional[str]): SQL WHERE clause evaluated by OGR to filter features. Defaults to None.
         **kwargs (Any): Additional keyword arguments to pass to the GeoPandas read_file function.
         
     Returns:
@@ -41,31 +64,260 @@ def load_vector(
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Vector file not found: {path}")
+
+    if path.suffix.lower() in _PARQUET_SUFFIXES:
+        return _load_geoparquet(path, columns=columns, bbox=bbox, where=where, **kwargs)
+
+    if columns is not None:
+        kwargs["columns"] = [col for col in columns if col != "geometry"]
+    if bbox is not None:
+        kwargs["bbox"] = tuple(bbox)
+    if where is not None:
+        kwargs["where"] = where
+    if engine == "pyogrio" and _HAS_PYARROW:
+        kwargs.setdefault("use_arrow", True)
     
     gdf = gpd.read_file(path, engine=engine, **kwargs)
     return Vector(gdf)
 
+def load_vectors(
+        paths: Sequence[Union[str, Path]],
+        workers: Optional[int] = None,
+        **kwargs: Any
+        ) -> Vector:
+    """
+    Loads several vector files concurrently and concatenates them into a single Vector.
+
+    pyogrio releases the GIL while reading, so files are parsed in parallel threads.
+    Layers whose CRS differs from the first file are reprojected to it before concatenation.
+
+    Args:
+        paths (Sequence[Union[str, Path]]): The vector files to load.
+        workers (Optional[int]): Maximum number of reader threads. Defaults to the ThreadPoolExecutor default.
+        **kwargs (Any): Additional keyword arguments passed to load_vector for every file.
+
+    Returns:
+        Vector: A Vector object holding the features of all files, with a fresh RangeIndex.
+    """
+    if not paths:
+        raise ValueError("Cannot load vectors from an empty list of paths.")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        frames = [vector.data for vector in executor.map(lambda p: load_vector(p, **kwargs), paths)]
+
+    target_crs = frames[0].crs
+    frames = [
+        gdf.to_crs(target_crs) if target_crs is not None and gdf.crs != target_crs else gdf
+        for gdf in frames
+    ]
+
+    combined = pd.concat(frames, ignore_index=True)
+    return Vector(gpd.GeoDataFrame(combined, geometry=frames[0].geometry.name, crs=target_crs))
+
+def _load_geoparquet(
+        path: Path,
+        columns: Optional[List[str]] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        where: Optional[str] = None,
+        **kwargs: Any
+        ) -> Vector:
+    """
+    Helper that reads a GeoParquet file, always retaining its primary geometry column.
+
+    Args:
+        path (Path): Path to the GeoParquet file.
+        columns (Optional[List[str]]): Attribute columns to read. Defaults to all.
+        bbox (Optional[Tuple[float, float, float, float]]): Spatial filter in the CRS of the file.
+        where (Optional[str]): Unsupported for GeoParquet, must be None.
+        **kwargs (Any): Additional keyword arguments to pass to gpd.read_parquet.
+
+    Returns:
+        Vector: A Vector object encapsulating the loaded GeoDataFrame.
+    """
+    if where is not None:
+        raise ValueError("The 'where' filter is not supported for GeoParquet inputs.")
+
+    if columns is not None:
+        import json
+        import pyarrow.parquet as pq
+
+        geo_meta = json.loads(pq.read_schema(path).metadata[b"geo"])
+        geometry_col = geo_meta["primary_column"]
+        columns = [col for col in columns if col not in ("geometry", geometry_col)] + [geometry_col]
+
+    gdf = gpd.read_parquet(path, columns=columns, bbox=bbox, **kwargs)
+    return Vector(gdf)
+
 def save_vector(
         vector: Vector, 
         path: Union[str, Path], 
         driver: str = None, 
         engine: str = "pyogrio", 
+        chunk_size: Optional[int] = None,
         **kwargs: Any
         ):
     """
     Saves a Vector object to the specified file path in a geospatial format.
+
+    When chunk_size is set and pyarrow is installed, features are streamed to OGR in 
+    Arrow record batches of that many rows through pyogrio.write_arrow (GDAL >= 3.8), 
+    so the Arrow copy never exceeds one batch instead of mirroring the full layer.
+
+    Paths with a .parquet or .geoparquet suffix are written as zstd-compressed GeoParquet 
+    (requires pyarrow) with per-row bounding-box covering columns, enabling row-group 
+    skipping on spatially filtered reads. The driver and engine arguments are ignored in that case.
     
     Args:
         vector (Vector): The Vector object to save.
         path (Union[str, Path]): The absolute or relative system path where the vector file will be saved.
         driver (str, optional): The OGR driver to use for writing the file. Defaults to None.
         engine (str): The GeoPandas engine to use for writing the file. Defaults to "pyogrio".
-        **kwargs (Any): Additional keyword arguments to pass to the GeoPandas to_file function.
+        chunk_size (Optional[int]): Rows per streamed record batch. Only used with the pyogrio engine. 
+            Defaults to None (single to_file call).
+        **kwargs (Any): Additional keyword arguments to pass to the GeoPandas to_file function, 
+            or to pyogrio.write_arrow when streaming.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix.lower() in _PARQUET_SUFFIXES:
+        kwargs.setdefault("compression", "zstd")
+        kwargs.setdefault("write_covering_bbox", True)
+        vector.data.to_parquet(path, **kwargs)
+        return
+
+    if chunk_size and engine == "pyogrio" and _HAS_PYARROW and len(vector) > 0:
+        _stream_vector(vector.data, path, driver, chunk_size, **kwargs)
+        return
+
     vector.data.to_file(path, driver=driver, engine=engine, **kwargs)
 
+def _stream_vector(
+        gdf: gpd.GeoDataFrame,
+        path: Path,
+        driver: Optional[str],
+        chunk_size: int,
+        **kwargs: Any
+        ) -> None:
+    """
+    Helper that writes a GeoDataFrame through pyogrio.write_arrow one record batch at a time.
+
+    Args:
+        gdf (gpd.GeoDataFrame): The non-empty frame to write.
+        path (Path): Destination file path.
+        driver (Optional[str]): OGR driver, inferred from the suffix when None.
+        chunk_size (int): Rows converted to Arrow per batch.
+        **kwargs (Any): Additional keyword arguments to pass to pyogrio.write_arrow.
+    """
+    import pyarrow as pa
+    import pyogrio
+
+    # Mirror to_file: only named or non-integer indexes are persisted as a column
+    write_index = gdf.index.name is not None or not pd.api.types.is_integer_dtype(gdf.index.dtype)
+
+    geom_types = set(gdf.geom_type.dropna().unique())
+    if len(geom_types) == 1:
+        geometry_type = geom_types.pop()
+    elif len(geom_types) == 2 and any(f"Multi{t}" in geom_types for t in geom_types):
+        geometry_type = next(t for t in geom_types if t.startswith("Multi"))
+    else:
+        geometry_type = "Unknown"
+    if geometry_type != "Unknown" and gdf.has_z.any():
+        geometry_type = f"{geometry_type} Z"
+
+    def _to_table(chunk: gpd.GeoDataFrame) -> Any:
+        return pa.table(chunk.to_arrow(index=write_index, geometry_encoding="WKB"))
+
+    # Object columns are typed per chunk (null for an all-None slice), so fix one schema 
+    # from the whole frame up front and cast every batch to it
+    schema = _to_table(gdf.iloc[:0]).schema
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            values = gdf[field.name] if field.name in gdf.columns else gdf.index
+            non_null = values.dropna().to_numpy()
+            arrow_type = pa.infer_type(non_null, from_pandas=True) if len(non_null) else pa.string()
+            schema = schema.set(i, field.with_type(arrow_type))
+
+    def _batches():
+        for start in range(0, len(gdf), chunk_size):
+            yield from _to_table(gdf.iloc[start:start + chunk_size]).cast(schema).to_batches()
+
+    reader = pa.RecordBatchReader.from_batches(schema, _batches())
+
+    pyogrio.write_arrow(
+        reader,
+        path,
+        driver=driver,
+        geometry_name=gdf.geometry.name,
+        geometry_type=geometry_type,
+        crs=gdf.crs.to_wkt() if gdf.crs is not None else None,
+        **kwargs
+    )
+
+@lru_cache(maxsize=8)
+def _cached_load_vector(
+        path: str,
+        mtime_ns: int,
+        frozen_kwargs: Tuple[Tuple[str, Any], ...]
+        ) -> Vector:
+    """
+    Helper memoising load_vector per path, modification time and read arguments.
+    The mtime component makes the cache miss as soon as the file changes on disk.
+    Every entry pins a full GeoDataFrame, so the cache is kept small.
+    The cached Vector is never handed out directly, see _resolve_path_vector.
+    """
+    return load_vector(path, **dict(frozen_kwargs))
+
+def _resolve_path_vector(
+        path: Union[str, Path],
+        load_kwargs: Dict[str, Any]
+        ) -> Vector:
+    """
+    Helper loading a Vector for resolve_vector through the session cache.
+
+    Args:
+        path (Union[str, Path]): Path to the vector file.
+        load_kwargs (Dict[str, Any]): Keyword arguments for load_vector.
+
+    Returns:
+        Vector: A new Vector over a copy of the cached data, so in-place edits never reach the cache.
+    """
+    path = Path(path)
+    frozen = tuple(sorted(
+        (key, tuple(val) if isinstance(val, list) else val) for key, val in load_kwargs.items()
+    ))
+
+    try:
+        hash(frozen)
+        mtime_ns = path.stat().st_mtime_ns
+    except (OSError, TypeError):
+        # Missing files surface load_vector's error; unhashable arguments bypass the cache
+        return load_vector(path, **load_kwargs)
+
+    # Without copy-on-write a shallow copy would share column blocks with the cache
+    return Vector(_cached_load_vector(str(path), mtime_ns, frozen).data.copy())
+
+def _vector_load_hints(
+        hints: Callable[[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+        ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Helper decorator attaching read hints that resolve_vector forwards to load_vector 
+    when resolving paths. Internal: must be applied beneath @resolve_vector. The hints callable receives the bound 
+    arguments of the call (earlier parameters already resolved to Vector objects) and 
+    returns a mapping of parameter name to load_vector keyword arguments, 
+    e.g. {"source_points": {"columns": ["species"]}}.
+
+    Args:
+        hints (Callable[[Dict[str, Any]], Dict[str, Dict[str, Any]]]): Function producing per-parameter load arguments.
+
+    Returns:
+        Callable[[Callable[..., Any]], Callable[..., Any]]: Decorator tagging the target function.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func._vector_load_hints = hints
+        return func
+    return decorator
+
 def resolve_vector(
         func: Callable[..., Any]
         ) -> Callable[..., Any]:
@@ -75,6 +327,8 @@ def resolve_vector(
     This function analyzes the target method's signature, evaluating type annotations and parameter 
     nomenclature. If a parameter expects a Vector but receives a string or Path, it intercepts the 
     execution to perform disk I/O, seamlessly injecting the loaded Vector object before runtime.
+    Loaded files are memoised per path and modification time, so the same file passed 
+    repeatedly is parsed once per session. Each call still receives its own copy of the data.
     
     Args:
         func (Callable[..., Any]): The target function or class method expecting a Vector input.
@@ -87,6 +341,7 @@ def resolve_vector(
             system path nor an instantiated Vector object.
     """
     sig = inspect.signature(func)
+    load_hints = getattr(func, "_vector_load_hints", None)
     
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -121,7 +376,8 @@ def resolve_vector(
 
             if expects_vector:
                 if isinstance(val, (str, Path)):
-                    bound_args.arguments[name] = load_vector(val)
+                    load_kwargs = load_hints(bound_args.arguments).get(name, {}) if load_hints else {}
+                    bound_args.arguments[name] = _resolve_path_vector(val, load_kwargs)
                 elif not isinstance(val, Vector):
                     raise TypeError(
                         f"Expected file path or Vector object for parameter '{name}', got {type(val)}"
@@ -1,9 +1,12 @@
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 import geopandas as gpd
 import polars as pl
+import shapely
+from scipy.spatial import cKDTree
 from geoindex_rs import rtree as rt
 
 log = logging.getLogger(__name__)
@@ -22,8 +25,9 @@ class Vector:
     Properties:
         crs: The Coordinate Reference System of the geometries in the GeoDataFrame.
         bounds: The bounding box of all geometries in the GeoDataFrame as (minx, miny, maxx, maxy).
-        columns: The list of column names in the GeoDataFrame.
+        columns: The tuple of column names in the GeoDataFrame.
         spatial_index (rt.RTree): A dynamically generated, zero-copy Rust spatial index containing the geometry bounds.
+        strtree (shapely.STRtree): A lazily built GEOS tree over the geometries, for predicate and nearest queries.
     """
     def __init__(self, data: gpd.GeoDataFrame):
         """
@@ -39,6 +43,10 @@ class Vector:
             raise TypeError(f"Expected GeoDataFrame, got {type(data)}")
         self._data = data
         self._spatial_index: Optional[rt.RTree] = None
+        self._strtree: Optional[shapely.STRtree] = None
+        self._point_trees: Dict[Optional[str], Tuple[Optional[cKDTree], np.ndarray]] = {}
+        self._validated = False
+        self._columns: Optional[Tuple[pd.Index, Tuple[str, ...], frozenset]] = None
 
     @property
     def data(self) -> gpd.GeoDataFrame:
@@ -65,6 +73,10 @@ class Vector:
             raise TypeError(f"Expected GeoDataFrame, got {type(value)}")
         self._data = value
         self._spatial_index = None
+        self._strtree = None
+        self._point_trees = {}
+        self._validated = False
+        self._columns = None
 
     @property
     def crs(self):
@@ -87,14 +99,37 @@ class Vector:
         return self._data.total_bounds
 
     @property
-    def columns(self):
+    def columns(self) -> Tuple[str, ...]:
         """
         Extracts the schema attributes currently associated with the geometries.
 
+        The tuple is cached against the identity of the underlying pandas column Index, 
+        which pandas replaces whenever columns are added, dropped or renamed.
+
+        Returns:
+            Tuple[str, ...]: The string identifiers corresponding to available feature columns.
+        """
+        return self._column_cache()[0]
+
+    @property
+    def column_set(self) -> frozenset:
+        """
+        Provides the feature column names as a frozenset for constant-time membership tests.
+
         Returns:
-            list: The string identifiers corresponding to available feature columns.
+            frozenset: The string identifiers corresponding to available feature columns.
+        """
+        return self._column_cache()[1]
+
+    def _column_cache(self) -> Tuple[Tuple[str, ...], frozenset]:
+        """
+        Helper that rebuilds the cached column views only when the column Index object changes.
         """
-        return self._data.columns.tolist()
+        index = self._data.columns
+        if self._columns is None or self._columns[0] is not index:
+            names = tuple(index)
+            self._columns = (index, names, frozenset(names))
+        return self._columns[1], self._columns[2]
 
     @property
     def spatial_index(self) -> rt.RTree:
@@ -119,6 +154,78 @@ class Vector:
         
         return self._spatial_index
 
+    @property
+    def strtree(self) -> shapely.STRtree:
+        """
+        Accesses or constructs a GEOS STRtree over the active geometries.
+
+        The tree is cached until the underlying data is replaced, so repeated joins 
+        against the same layer pay the build cost once.
+
+        Returns:
+            shapely.STRtree: A tree whose integer results are positions into the geometry array.
+        """
+        if self._strtree is None:
+            self._strtree = shapely.STRtree(self._data.geometry.values)
+        
+        return self._strtree
+
+    def point_coordinates(
+            self,
+            attribute: Optional[str] = None
+            ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extracts the (x, y) coordinates of point geometries, optionally restricted to rows with a non-null attribute.
+
+        Args:
+            attribute (Optional[str]): Column whose null rows are excluded. Defaults to None (all rows).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The row positions kept and their (N, 2) coordinate array.
+
+        Raises:
+            ValueError: If a kept row holds anything other than a non-empty Point geometry.
+        """
+        geoms = self._data.geometry.values
+        if attribute is None:
+            positions = np.arange(len(geoms))
+        else:
+            positions = np.flatnonzero(~pd.isna(self._data[attribute].to_numpy()))
+            geoms = geoms[positions]
+
+        is_point = shapely.get_type_id(geoms) == shapely.GeometryType.POINT
+        if not is_point.all() or shapely.is_empty(geoms).any():
+            raise ValueError("x/y coordinate access only provided for non-empty Point geometries.")
+
+        return positions, np.column_stack((shapely.get_x(geoms), shapely.get_y(geoms)))
+
+    def point_tree(
+            self,
+            attribute: Optional[str] = None
+            ) -> Tuple[Optional[cKDTree], np.ndarray]:
+        """
+        Accesses or constructs a KD-tree over the point coordinates for nearest-neighbour queries.
+
+        Trees are cached per attribute filter until the underlying data is replaced, 
+        so repeated joins against the same point layer build the tree once.
+        The cache is only reset by assigning Vector.data. In-place edits of the frame 
+        (e.g. vector.data.loc[mask, attribute] = None) leave the cached tree stale; 
+        reassign the data (vector.data = vector.data) after such edits.
+
+        Args:
+            attribute (Optional[str]): Column whose null rows are excluded from the tree. Defaults to None.
+
+        Returns:
+            Tuple[Optional[cKDTree], np.ndarray]: The tree (None when no point qualifies) 
+                and the row positions its points map back to.
+        """
+        if attribute not in self._point_trees:
+            positions, coords = self.point_coordinates(attribute)
+            tree = cKDTree(coords) if len(coords) else None
+            self._point_trees[attribute] = (tree, positions)
+        
+        return self._point_trees[attribute]
+
     def query_bounds(
             self, 
             minx: float, 
@@ -4,16 +4,20 @@
 This module provides spatial operations for vector data, including attribute transfer, treetop labeling, and crown delineation.
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 import logging
 
 import numpy as np
+import pandas as pd
 import geopandas as gpd
+import shapely
+from pyproj import CRS, Transformer
 from scipy.spatial import cKDTree
 
 from phytospatial.vector.layer import Vector
-from phytospatial.vector.io import resolve_vector
-from phytospatial.vector.geom import validate
+from phytospatial.vector.io import resolve_vector, _vector_load_hints
+from phytospatial.vector.geom import validate, to_crs
 
 log = logging.getLogger(__name__)
 
@@ -25,58 +29,114 @@ __all__ = [
     "assign_tree_ids_to_crowns"
 ]
 
+@lru_cache(maxsize=16)
+def _get_transformer(
+    source_crs: CRS,
+    target_crs: CRS
+    ) -> Transformer:
+    """
+    Helper caching PROJ transformers, whose pipeline construction dominates small reprojections.
+    """
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
 def _transfer_attributes(
     target_gdf: gpd.GeoDataFrame,
-    source_gdf: gpd.GeoDataFrame,
+    source_vector: Vector,
     transfer_col: str, 
     max_dist: float,
     target_col_name: str
     ) -> gpd.GeoDataFrame:
     """
-    Transfers attributes from source_gdf to target_gdf based on spatial proximity.
+    Transfers attributes from source_vector to target_gdf based on spatial proximity.
+
+    When both layers share a CRS, the KD-tree cached on source_vector is reused across calls.
     
     Args:
         target_gdf (gpd.GeoDataFrame): The GeoDataFrame to which attributes will be transferred.
-        source_gdf (gpd.GeoDataFrame): The GeoDataFrame from which attributes will be transferred.
-        transfer_col (str): The column name in the source GeoDataFrame containing the attributes to transfer.
+        source_vector (Vector): The point Vector from which attributes will be transferred.
+        transfer_col (str): The column name in the source Vector containing the attributes to transfer.
         max_dist (float): The maximum distance for spatial proximity matching.
         target_col_name (str): The column name in the target GeoDataFrame where the transferred attributes will be stored.
 
     Returns:
         gpd.GeoDataFrame: The updated target GeoDataFrame with transferred attributes.
     """
+    source_gdf = source_vector.data
     if transfer_col not in source_gdf.columns:
         raise ValueError(f"Column '{transfer_col}' not found in source vector.")
 
-    if target_gdf.crs != source_gdf.crs:
-        source_gdf = source_gdf.to_crs(target_gdf.crs)
+    # Work on the raw shapely arrays to bypass GeoSeries construction and index alignment
+    target_centroids = shapely.centroid(target_gdf.geometry.values)
+    target_coords = np.column_stack((shapely.get_x(target_centroids), shapely.get_y(target_centroids)))
 
-    target_centroids = target_gdf.geometry.centroid
-    target_coords = np.column_stack((target_centroids.x, target_centroids.y))
-    
-    source_coords = np.column_stack((source_gdf.geometry.x, source_gdf.geometry.y))
-
-    tree = cKDTree(source_coords)
-
-    distances, indices = tree.query(
-        target_coords, 
-        k=1, 
-        distance_upper_bound=max_dist,
-        workers=-1
-    )
+    # Unlabelled points are left out of the tree: they can never win a match
+    if target_gdf.crs == source_gdf.crs:
+        tree, positions = source_vector.point_tree(transfer_col)
+        n_source = len(positions)
+    else:
+        if target_gdf.crs is None or source_gdf.crs is None:
+            raise ValueError("Cannot transfer attributes between vectors when one of them has no CRS.")
 
-    valid_mask = distances <= max_dist
-    valid_indices = indices[valid_mask]
+        # Only point coordinates feed the tree, so reproject the raw arrays instead of the geometries
+        positions, source_coords = source_vector.point_coordinates(transfer_col)
+        source_x, source_y = _get_transformer(source_gdf.crs, target_gdf.crs).transform(
+            source_coords[:, 0], source_coords[:, 1]
+        )
+        n_source = len(positions)
+        tree = cKDTree(np.column_stack((source_x, source_y))) if n_source else None
 
-    source_values = source_gdf[transfer_col].iloc[valid_indices].values
+    source_labels = source_gdf[transfer_col].to_numpy()[positions]
 
-    if target_col_name not in target_gdf.columns:
-        target_gdf[target_col_name] = None
+    if n_source == 0 or len(target_coords) == 0:
+        match = np.full(len(target_coords), -1, dtype=np.intp)
+    else:
+        # k=1 yields a single nearest hit per target; misses come back as index == n_source
+        _, indices = tree.query(
+            target_coords, 
+            k=1, 
+            distance_upper_bound=max_dist,
+            workers=-1
+        )
+
+        match = np.where(indices < n_source, indices, -1)
+
+    valid_mask = match >= 0
+
+    # Replace the whole column in one assignment rather than writing through .loc
+    if target_col_name in target_gdf.columns:
+        existing = target_gdf[target_col_name].to_numpy()
+        if existing.dtype != object and np.can_cast(source_labels.dtype, existing.dtype, casting="same_kind"):
+            # Numeric codes: masked overwrite stays in the native dtype, no per-element boxing
+            labels = existing.copy()
+        else:
+            labels = existing.astype(object)
+        labels[valid_mask] = source_labels[match[valid_mask]]
+    else:
+        # Single gather pass that fills misses and keeps the source dtype where possible
+        labels = pd.api.extensions.take(source_labels, match, allow_fill=True)
+        if labels.dtype == object:
+            labels[~valid_mask] = None
 
-    target_gdf.loc[valid_mask, target_col_name] = source_values
+    target_gdf[target_col_name] = labels
 
     return target_gdf
 
+def _as_int64(
+    values: np.ndarray
+    ) -> np.ndarray:
+    """
+    Helper that casts identifiers to int64 in one vectorised pass, returning them unchanged 
+    when they are not integer-representable (NaN, None or non-numeric strings).
+    """
+    if values.dtype.kind in "iub":
+        return values.astype(np.int64, copy=False)
+    if values.dtype.kind == "f" and not np.isfinite(values).all():
+        return values
+    try:
+        return values.astype(np.int64)
+    except (ValueError, TypeError, OverflowError):
+        return values
+
 @resolve_vector
 def prepare_itcd_vectors(
     vector: Vector, 
@@ -94,13 +154,15 @@ def prepare_itcd_vectors(
             If None, a new 'crown_id' column will be created using the index. Defaults to None.
         species_col (Optional[str]): The name of the column containing species information. 
             If None, a new 'species' column will be created with null values. Defaults to None.
-        do_validate (bool): Whether to validate geometries and optionally fix or drop invalid ones. Defaults to True.
+        do_validate (bool): Whether to validate geometries and optionally fix or drop invalid ones. 
+            Skipped for Vectors already flagged by validate(). The flag is only reset by assigning 
+            Vector.data, so reassign the data after in-place geometry edits. Defaults to True.
         fix_invalid (bool): If do_validate is True, whether to attempt fixing invalid geometries before dropping them. Defaults to True.
 
     Returns: A prepared Vector with standardized columns and validated geometries, ready for ITCD processing.
     """
     
-    if do_validate:
+    if do_validate and not vector._validated:
         vector = validate(vector, fix_invalid=fix_invalid, drop_invalid=True, inplace=False)
         if len(vector) == 0:
             raise ValueError("No valid geometries remaining after validation!")
@@ -109,29 +171,29 @@ def prepare_itcd_vectors(
 
     if id_col and id_col in gdf.columns:
         if id_col != 'crown_id':
-            gdf = gdf.rename(columns={id_col: 'crown_id'})
-        
-        if gdf['crown_id'].duplicated().any():
-            gdf['crown_id'] = gdf.index
+            gdf.rename(columns={id_col: 'crown_id'}, inplace=True)
+
+        # Cast before the uniqueness check so it runs on a flat int64 hash table
+        crown_ids = _as_int64(gdf['crown_id'].to_numpy())
+        if not pd.Index(crown_ids).is_unique:
+            crown_ids = _as_int64(gdf.index.to_numpy())
     else:
-        gdf['crown_id'] = gdf.index
+        crown_ids = _as_int64(gdf.index.to_numpy())
 
-    try:
-        gdf['crown_id'] = gdf['crown_id'].astype(int)
-    except (ValueError, TypeError):
-        pass
+    gdf['crown_id'] = crown_ids
 
     if species_col and species_col in gdf.columns:
         if species_col != 'species':
-            gdf = gdf.rename(columns={species_col: 'species'})
+            gdf.rename(columns={species_col: 'species'}, inplace=True)
     else:
         if 'species' not in gdf.columns:
             gdf['species'] = None
 
-    gdf.index = gdf['crown_id']
-    gdf.index.name = None
+    gdf.index = pd.Index(crown_ids)
     
-    return Vector(gdf)
+    prepared = Vector(gdf)
+    prepared._validated = vector._validated
+    return prepared
 
 @resolve_vector
 def prepare_treetop_vectors(
@@ -174,7 +236,26 @@ def prepare_treetop_vectors(
         
     return Vector(gdf)
 
+def _label_source_hints(
+    args: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+    """
+    Helper that restricts the source points read from disk to the label column.
+
+    No per-call spatial filter is pushed down: the load arguments are part of the 
+    resolve_vector cache key, and a bbox derived from each target would miss the cache 
+    whenever the same points file is matched against successive crown tiles.
+
+    Args:
+        args (Dict[str, Any]): Bound arguments of label_tree_crowns.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: load_vector keyword arguments for 'source_points'.
+    """
+    return {"source_points": {"columns": [args["label_col"]]}}
+
 @resolve_vector
+@_vector_load_hints(_label_source_hints)
 def label_tree_crowns(
     target_vector: Vector,
     source_points: Vector,
@@ -194,11 +275,10 @@ def label_tree_crowns(
         Vector: A new Vector with tree crowns labeled with species information from nearby source points.
     """
     target_gdf = target_vector.data.copy()
-    source_gdf = source_points.data
 
     updated_gdf = _transfer_attributes(
         target_gdf=target_gdf,
-        source_gdf=source_gdf,
+        source_vector=source_points,
         transfer_col=label_col,
         max_dist=max_dist,
         target_col_name='species'
@@ -230,6 +310,11 @@ def assign_tree_ids_to_crowns(
     Executes a spatial intersection to map master tree anchor IDs to corresponding crown polygons.
     Enforces a strict one-to-one relationship by retaining only the first intersecting anchor.
 
+    When a crown intersects several anchors (multi-treetop crowns), the anchor with the 
+    lowest row position in trees is kept, independently of spatial index query order.
+    An anchor claimed by several crowns goes to the crown with the lowest row position, 
+    and distinct anchors sharing a tree_id keep only the first crown in crown order.
+
     Args:
         crowns (Vector): The vector layer containing the unmapped crown polygons.
         trees (Vector): The master tree points containing the recognized database identities.
@@ -238,16 +323,27 @@ def assign_tree_ids_to_crowns(
         Vector: A filtered vector containing polygons paired with their unique tree IDs.
     """
     if crowns.crs != trees.crs:
-        trees = trees.to_crs(crowns.crs)
+        trees = to_crs(trees, crowns.crs)
 
-    anchors_gdf = trees.data[["tree_id", "geometry"]].copy()
-    joined_gdf = gpd.sjoin(crowns.data, anchors_gdf, how="inner", predicate="intersects")
-    
-    joined_gdf = joined_gdf[~joined_gdf.index.duplicated(keep="first")]
-    
-    if "tree_id" in joined_gdf.columns:
+    crown_pos, tree_pos = trees.strtree.query(crowns.data.geometry.values, predicate="intersects")
+
+    # Sort pairs by crown then anchor position, then keep the first anchor of each crown
+    order = np.lexsort((tree_pos, crown_pos))
+    crown_pos, tree_pos = crown_pos[order], tree_pos[order]
+    _, first = np.unique(crown_pos, return_index=True)
+    crown_pos, tree_pos = crown_pos[first], tree_pos[first]
+
+    # Keep the first crown of each anchor on integer positions instead of hashing id values
+    _, first = np.unique(tree_pos, return_index=True)
+    first.sort()
+    crown_pos, tree_pos = crown_pos[first], tree_pos[first]
+
+    tree_ids = trees.data["tree_id"]
+    joined_gdf = crowns.data.iloc[crown_pos].copy()
+    joined_gdf["tree_id"] = tree_ids.to_numpy()[tree_pos]
+
+    # Distinct anchors sharing an id still collapse to their first crown
+    if not tree_ids.is_unique:
         joined_gdf = joined_gdf.drop_duplicates(subset=["tree_id"], keep="first")
-        
-    joined_gdf = joined_gdf.drop(columns=["index_right"])
     
     return Vector(joined_gdf)
\ No newline at end of file
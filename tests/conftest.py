@@ -2,23 +2,35 @@
 
 import pytest
 import numpy as np
+import geopandas as gpd
 import rasterio
 from rasterio.transform import Affine
 from rasterio.crs import CRS
 
-@pytest.fixture
-def source_envi_path(tmp_path):
+@pytest.fixture(autouse=True, scope="session")
+def _pyogrio_engine():
+    """
+    Fixture: Pins GeoPandas vector I/O to the vectorized pyogrio engine for the whole session.
+    """
+    previous = gpd.options.io_engine
+    gpd.options.io_engine = "pyogrio"
+    yield
+    gpd.options.io_engine = previous
+
+@pytest.fixture(scope="session")
+def source_envi_path(tmp_path_factory):
     """
     Fixture: Creates a synthetic ENVI file (.hdr + binary) in a temp dir.
     This strictly simulates the 'RAW_HDR' input format.
+    Written once per session; consumers must treat it as read-only.
     """
-    p = tmp_path / "synthetic_raw"
+    p = tmp_path_factory.mktemp("envi") / "synthetic_raw"
     
     width, height = 100, 100
     transform = Affine.translation(0, 1) * Affine.scale(0.01, -0.01)
     crs = CRS.from_epsg(4326)
     
-    data = np.zeros((3, height, width), dtype='float32')
+    data = np.empty((3, height, width), dtype='float32')
     data[0] = np.linspace(0, 1, width * height).reshape(height, width) # Gradient
     data[1] = np.random.rand(height, width) # Noise
     data[2].fill(0.5)
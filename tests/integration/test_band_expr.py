@@ -0,0 +1,59 @@
+# tests/integration/test_band_expr.py
+
+import pytest
+import numpy as np
+from rasterio.transform import Affine
+
+from phytospatial.raster.layer import Raster
+
+def _two_band_raster(nir, red, dtype, nodata=None, band_names=None):
+    data = np.array([[nir], [red]], dtype=dtype)
+    return Raster(
+        data=data,
+        transform=Affine.identity(),
+        crs="EPSG:32619",
+        nodata=nodata,
+        band_names=band_names
+    )
+
+def test_ndvi_zero_is_not_nodata():
+    """
+    A valid NDVI of 0 must stay distinguishable from masked pixels on integer rasters.
+    """
+    raster = _two_band_raster([5, 0, 7], [5, 3, 1], dtype="uint16", nodata=0)
+    result = raster.ndvi(nir=1, red=2)
+
+    assert result.data.dtype == np.float32
+    assert np.isnan(result.nodata)
+    assert result.data[0, 0, 0] == 0.0
+    assert np.isnan(result.data[0, 0, 1])
+    assert np.isclose(result.data[0, 0, 2], 0.75)
+
+def test_ndvi_resolves_bands_by_wavelength():
+    """
+    Bands left unspecified are matched through the NDVI wavelengths of the IndexCatalog.
+    """
+    raster = _two_band_raster(
+        [0.2, 0.0], [0.6, 0.0], dtype="float32",
+        band_names={"Red (655nm)": 2, "NIR (842nm)": 1}
+    )
+    result = raster.ndvi()
+
+    assert np.isclose(result.data[0, 0, 0], (0.2 - 0.6) / (0.2 + 0.6))
+    assert np.isnan(result.data[0, 0, 1])  # Zero denominator
+
+    with pytest.raises(ValueError):
+        _two_band_raster([1], [1], dtype="float32", band_names={"a": 1, "b": 2}).ndvi()
+
+def test_band_expr_rejects_integer_dtype():
+    """
+    Integer outputs cannot hold the NaN nodata and are refused.
+    """
+    raster = _two_band_raster([4, 2], [2, 0], dtype="uint8", nodata=0)
+
+    with pytest.raises(ValueError):
+        raster.band_expr("divide", 1, 2, dtype="int16")
+
+    result = raster.band_expr("divide", 1, 2, dtype="float64")
+    assert result.data[0, 0, 0] == 2.0
+    assert np.isnan(result.data[0, 0, 1])
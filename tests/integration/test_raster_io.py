@@ -0,0 +1,31 @@
+# tests/integration/test_raster_io.py
+
+import numpy as np
+
+from phytospatial.raster import io
+from phytospatial.raster.layer import Raster
+from phytospatial.raster.partition import iter_windows
+from helpers import assert_grid_match
+
+def test_write_windows_round_trip(tmp_path, source_envi_path):
+    """
+    Integration test validating that tiles streamed through write_windows
+    reassemble the source raster exactly.
+    """
+    source = io.load(source_envi_path)
+
+    target_path = tmp_path / "stitched.tif"
+    blank = Raster(
+        data=np.zeros_like(source.data),
+        transform=source.transform,
+        crs=source.crs,
+        nodata=source.nodata
+    )
+    io.save(blank, target_path)
+
+    written = io.write_windows(iter_windows(source, tile_size=32, overlap=4), target_path)
+    assert written == 16
+
+    stitched = io.load(target_path)
+    assert_grid_match(source, stitched)
+    assert np.array_equal(stitched.data, source.data)
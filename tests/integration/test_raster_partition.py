@@ -0,0 +1,73 @@
+# tests/integration/test_raster_partition.py
+
+import pytest
+import numpy as np
+import rasterio
+from rasterio.transform import Affine
+
+from phytospatial.raster import io
+from phytospatial.raster.layer import Raster
+from phytospatial.raster.partition import iter_tiles, iter_windows
+
+def test_iter_tiles_lockstep(source_envi_path):
+    """
+    Integration test validating that path-based tile generators consumed in lockstep
+    survive one of them finishing first, and that tiles match the in-memory raster.
+    """
+    reference = io.load(source_envi_path)
+
+    short = iter_tiles(source_envi_path, tile_size=50)
+    long = iter_tiles(source_envi_path, tile_size=25)
+
+    for (_, tile_a), (_, tile_b) in zip(short, long):
+        assert tile_a.crs == tile_b.crs
+
+    # The first generator is exhausted; the second must keep reading
+    for window, tile in long:
+        row_slice, col_slice = window.toslices()
+        assert np.array_equal(tile.data, reference.data[:, row_slice, col_slice])
+
+def test_iter_tiles_open_dataset(source_envi_path):
+    """
+    Integration test validating tiling a caller-supplied dataset handle.
+    """
+    reference = io.load(source_envi_path)
+
+    with rasterio.open(source_envi_path.with_suffix("")) as src:
+        tiles = list(iter_tiles(src, tile_size=40, overlap=8))
+
+    for window, tile in tiles:
+        row_slice, col_slice = window.toslices()
+        assert np.array_equal(tile.data, reference.data[:, row_slice, col_slice])
+        assert tile.transform == rasterio.windows.transform(window, reference.transform)
+
+@pytest.mark.parametrize("nodata", [0, np.nan])
+def test_iter_windows_skip_empty(nodata):
+    """
+    Integration test validating that skip_empty drops all-nodata tiles only,
+    including tiles whose single valid pixel is missed by the strided pre-check.
+    """
+    data = np.full((1, 64, 64), nodata, dtype="float32")
+    data[0, 5, 5] = 1.0          # Off the 1/16 sample grid of the top-left tile
+    data[0, 32:, 32:] = 2.0      # Bottom-right tile fully valid
+    raster = Raster(data=data, transform=Affine.identity(), crs="EPSG:32619", nodata=nodata)
+
+    kept = [(w.row_off, w.col_off) for w, _ in iter_windows(raster, tile_size=32, skip_empty=True)]
+    assert kept == [(0, 0), (32, 32)]
+
+    all_tiles = list(iter_windows(raster, tile_size=32))
+    assert len(all_tiles) == 4
+
+def test_iter_windows_skip_empty_without_nodata():
+    """
+    skip_empty is a no-op when the raster declares no nodata value.
+    """
+    raster = Raster(
+        data=np.zeros((1, 64, 64), dtype="float32"),
+        transform=Affine.identity(),
+        crs="EPSG:32619",
+        nodata=None
+    )
+
+    tiles = list(iter_windows(raster, tile_size=32, skip_empty=True))
+    assert len(tiles) == 4
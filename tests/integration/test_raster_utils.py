@@ -37,7 +37,7 @@ def test_raster_utils(tmp_path, source_envi_path):
     # Reprojection check
     target_crs = "EPSG:3857"
     reprojected = geom.reproject(stacked, target_crs=target_crs)
-    assert reprojected.crs.to_string() == target_crs
+    assert reprojected.crs.to_epsg() == 3857
     assert_raster_integrity(reprojected, stacked)
 
 
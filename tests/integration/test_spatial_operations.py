@@ -0,0 +1,54 @@
+# tests/integration/test_spatial_operations.py
+
+import geopandas as gpd
+from shapely.geometry import Point, box
+
+from phytospatial.vector import Vector
+from phytospatial.vector.spatial_operations import assign_tree_ids_to_crowns
+
+X0, Y0 = 500000.0, 5000000.0
+
+def _utm_box(minx, miny, maxx, maxy):
+    return box(X0 + minx, Y0 + miny, X0 + maxx, Y0 + maxy)
+
+def _utm_point(x, y):
+    return Point(X0 + x, Y0 + y)
+
+def test_assign_tree_ids_to_crowns():
+    """
+    Integration test validating the one-to-one crown/anchor pairing rules,
+    with the anchors supplied in a different CRS than the crowns.
+    """
+    crowns = Vector(gpd.GeoDataFrame(
+        {"crown": ["multi", "shared_first", "shared_second", "dup_first", "dup_second", "empty"]},
+        geometry=[
+            _utm_box(0, 0, 2, 2),
+            _utm_box(4, 4, 6, 6),
+            _utm_box(4.5, 4.5, 6.5, 6.5),
+            _utm_box(9, 9, 11, 11),
+            _utm_box(19, 19, 21, 21),
+            _utm_box(30, 30, 32, 32)
+        ],
+        crs="EPSG:32619"
+    ))
+
+    # Two anchors fall in the first crown; the lower row position must win.
+    # Anchor "c" sits in two overlapping crowns; the first crown must claim it.
+    # Two distinct anchors share the id "d"; only the first crown may keep it.
+    anchors = gpd.GeoDataFrame(
+        {"tree_id": ["b", "a", "c", "d", "d"]},
+        geometry=[
+            _utm_point(1.5, 1.5),
+            _utm_point(1, 1),
+            _utm_point(5.5, 5.5),
+            _utm_point(10, 10),
+            _utm_point(20, 20)
+        ],
+        crs="EPSG:32619"
+    ).to_crs("EPSG:4326")
+
+    result = assign_tree_ids_to_crowns(crowns, Vector(anchors))
+
+    assert result.crs == crowns.crs
+    assert result.data["crown"].tolist() == ["multi", "shared_first", "dup_first"]
+    assert result.data["tree_id"].tolist() == ["b", "c", "d"]
@@ -0,0 +1,129 @@
+# tests/integration/test_vector_io.py
+
+import pytest
+import pandas as pd
+import geopandas as gpd
+from shapely.geometry import Point, box
+
+from phytospatial.vector import Vector
+from phytospatial.vector.io import load_vector, load_vectors, save_vector
+from phytospatial.vector.spatial_operations import prepare_itcd_vectors, label_tree_crowns
+
+def test_resolved_vector_isolated_from_cache(tmp_path):
+    """
+    Integration test validating that mutating a Vector resolved from a path
+    never leaks into later resolutions of the same file.
+    """
+    crowns_path = tmp_path / "crowns.gpkg"
+    gpd.GeoDataFrame(
+        {"cid": [1, 2], "note": ["a", "b"]},
+        geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)],
+        crs="EPSG:32619"
+    ).to_file(crowns_path, driver="GPKG")
+
+    first = prepare_itcd_vectors(crowns_path, id_col="cid", do_validate=False)
+    first.data.loc[first.data.index[0], "note"] = "MUTATED"
+
+    second = prepare_itcd_vectors(crowns_path, id_col="cid", do_validate=False)
+    assert list(second.data["note"]) == ["a", "b"]
+
+def test_prepared_vectors_independent_of_inputs():
+    """
+    Integration test validating that prepare_itcd_vectors and label_tree_crowns
+    return Vectors whose columns never alias those of their inputs.
+    """
+    crowns = Vector(gpd.GeoDataFrame(
+        {"cid": [1, 2], "note": ["a", "b"]},
+        geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)],
+        crs="EPSG:32619"
+    ))
+    points = Vector(gpd.GeoDataFrame(
+        {"species": ["Oak", "Pine"]},
+        geometry=[Point(0.5, 0.5), Point(2.5, 2.5)],
+        crs="EPSG:32619"
+    ))
+
+    prepared = prepare_itcd_vectors(crowns, id_col="cid", do_validate=False)
+    prepared.data.loc[prepared.data.index[0], "note"] = "MUTATED"
+    assert list(crowns.data["note"]) == ["a", "b"]
+
+    labelled = label_tree_crowns(prepared, points, label_col="species")
+    assert list(labelled.data["species"]) == ["Oak", "Pine"]
+
+    labelled.data.loc[labelled.data.index[1], "note"] = "MUTATED"
+    assert list(prepared.data["note"]) == ["MUTATED", "b"]
+
+@pytest.mark.parametrize("species", [
+    [None, None, None, "Oak", "Pine", None],
+    ["Oak", "Pine", None, None, None, None],
+])
+def test_save_vector_streamed_nulls(tmp_path, species):
+    """
+    Integration test validating a chunked save_vector round trip when some
+    chunks of an attribute column hold only nulls.
+    """
+    pytest.importorskip("pyarrow")
+
+    points = Vector(gpd.GeoDataFrame(
+        {"species": species, "height": [float(i) for i in range(len(species))]},
+        geometry=[Point(i, i) for i in range(len(species))],
+        crs="EPSG:32619"
+    ))
+
+    out_path = tmp_path / "points.gpkg"
+    save_vector(points, out_path, chunk_size=3)
+
+    reloaded = load_vector(out_path)
+    assert len(reloaded) == len(points)
+    assert [None if pd.isna(v) else v for v in reloaded.data["species"]] == species
+    assert reloaded.data["height"].tolist() == points.data["height"].tolist()
+
+def test_geoparquet_round_trip(tmp_path):
+    """
+    Integration test validating GeoParquet save/load with column and bbox pushdown.
+    """
+    pytest.importorskip("pyarrow")
+
+    points = Vector(gpd.GeoDataFrame(
+        {"species": ["Oak", "Pine", "Birch"], "height": [12.0, 18.5, 9.0]},
+        geometry=[Point(0, 0), Point(10, 10), Point(20, 20)],
+        crs="EPSG:32619"
+    ))
+
+    out_path = tmp_path / "points.parquet"
+    save_vector(points, out_path)
+
+    full = load_vector(out_path)
+    assert full.data["species"].tolist() == ["Oak", "Pine", "Birch"]
+    assert full.crs == points.crs
+
+    subset = load_vector(out_path, columns=["species"], bbox=(5, 5, 15, 15))
+    assert set(subset.data.columns) == {"species", subset.data.geometry.name}
+    assert subset.data["species"].tolist() == ["Pine"]
+
+    with pytest.raises(ValueError):
+        load_vector(out_path, where="height > 10")
+
+def test_load_vectors_mixed_crs(tmp_path):
+    """
+    Integration test validating concurrent loading of layers in different CRSs.
+    """
+    utm = gpd.GeoDataFrame(
+        {"species": ["Oak", "Pine"]},
+        geometry=[Point(500000, 5000000), Point(500100, 5000100)],
+        crs="EPSG:32619"
+    )
+    utm_path = tmp_path / "utm.gpkg"
+    geographic_path = tmp_path / "geographic.gpkg"
+    utm.iloc[:1].to_file(utm_path, driver="GPKG")
+    utm.iloc[1:].to_crs("EPSG:4326").to_file(geographic_path, driver="GPKG")
+
+    combined = load_vectors([utm_path, geographic_path], workers=2)
+
+    assert combined.crs.to_epsg() == 32619
+    assert combined.data["species"].tolist() == ["Oak", "Pine"]
+    assert list(combined.data.index) == [0, 1]
+    assert combined.data.geometry.iloc[1].distance(utm.geometry.iloc[1]) < 1e-3
+
+    with pytest.raises(ValueError):
+        load_vectors([])
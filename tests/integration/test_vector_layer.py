@@ -0,0 +1,39 @@
+# tests/integration/test_vector_layer.py
+
+import pytest
+import geopandas as gpd
+from shapely.geometry import Point, box
+
+from phytospatial.vector import Vector
+from phytospatial.vector.spatial_operations import label_tree_crowns
+
+def test_point_tree_requires_points():
+    """
+    Integration test validating that non-Point label layers fail with an explicit error.
+    """
+    crowns = Vector(gpd.GeoDataFrame(geometry=[box(0, 0, 1, 1)], crs="EPSG:32619"))
+    polygons = Vector(gpd.GeoDataFrame(
+        {"species": ["Oak"]}, geometry=[box(0, 0, 1, 1)], crs="EPSG:32619"
+    ))
+
+    with pytest.raises(ValueError, match="Point"):
+        label_tree_crowns(crowns, polygons, label_col="species")
+
+def test_point_tree_reset_on_data_assignment():
+    """
+    Integration test validating that reassigning Vector.data rebuilds the cached point tree.
+    """
+    points = Vector(gpd.GeoDataFrame(
+        {"species": ["Oak", "Pine"]},
+        geometry=[Point(0, 0), Point(5, 5)],
+        crs="EPSG:32619"
+    ))
+
+    _, positions = points.point_tree("species")
+    assert list(positions) == [0, 1]
+
+    points.data.loc[points.data.index[0], "species"] = None
+    points.data = points.data
+
+    _, positions = points.point_tree("species")
+    assert list(positions) == [1]